@@ -7,21 +7,31 @@ and sends opportunities to Telegram.
 import feedparser
 import requests
 import time
-import schedule
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, Optional, Tuple
 import os
-import json
+import io
+import html
+import re
+import orjson
 import hashlib
 import random
 import logging
 import sys
 import traceback
-from functools import wraps
-import signal
+import asyncio
+import sqlite3
+import string
+import threading
+from collections import defaultdict
+from functools import wraps, lru_cache, cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -43,29 +53,83 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Daily run times (24-hour clock, local time)
+RUN_TIMES = ("07:00", "12:00", "16:00")
 
-def timeout_handler(signum, frame):
-    """Handler for timeout signal"""
-    raise TimeoutError("Operation timed out")
+# No runs during quiet hours: from 10 PM until 7 AM (local time)
+QUIET_HOURS_START = 22
+QUIET_HOURS_END = 7
 
+# Each run posts a random number of opportunities in this range (inclusive)
+POSTS_PER_RUN = (1, 3)
 
-def with_timeout(timeout_seconds=15):
-    """Decorator to add timeout to a function"""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Set the signal handler and alarm
-            old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(timeout_seconds)
-            try:
-                result = func(*args, **kwargs)
-            finally:
-                # Disable the alarm and restore old handler
-                signal.alarm(0)
-                signal.signal(signal.SIGALRM, old_handler)
-            return result
-        return wrapper
-    return decorator
+# Longest single sleep in the main loop, so clock corrections (e.g. NTP sync on a Pi without an RTC) are noticed
+MAX_SLEEP_SECONDS = 60 * 60
+
+# Newest entries taken from each feed
+MAX_ENTRIES_PER_FEED = 10
+
+# XML namespaces understood by the streaming feed parser
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+RSS1_NS = '{http://purl.org/rss/1.0/}'
+MEDIA_NS = '{http://search.yahoo.com/mrss/}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+
+# Posted articles are remembered for 7 days
+HISTORY_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+# Telegram file_ids of uploaded images are reused for 7 days
+TELEGRAM_FILE_ID_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Images are downloaded and uploaded to Telegram ourselves, within these limits
+IMAGE_DOWNLOAD_TIMEOUT = 5
+IMAGE_DOWNLOAD_MAX_BYTES = 5 * 1024 * 1024
+
+# Maximum number of Gemini requests in flight at once
+GEMINI_MAX_CONCURRENCY = 4
+
+# Gemini request budget: bursts of up to 10, refilled at 10 requests per minute
+GEMINI_BURST = 10
+GEMINI_REQUESTS_PER_MINUTE = 10
+
+# Upper bound for a single (streamed) Gemini request, in seconds
+GEMINI_REQUEST_TIMEOUT = 120
+
+# Items packed into a single Gemini request
+GEMINI_ITEMS_PER_REQUEST = 50
+
+# Message used when message_templates.json has no usable template for the style
+DEFAULT_MESSAGE_TEMPLATE = """
+{emoji} *VC/Startup Opportunity Detected*
+
+*Source:* {source}
+*Title:* {title}
+
+*Type:* {opportunity_type}
+
+*Key Insights:*
+{explanation}
+
+*Link:* {link}
+
+_Analyzed at {timestamp}_
+_Style: {style}_
+"""
+
+# Prompt used when prompts.json is missing
+DEFAULT_PROMPT = """Analyze the following VC and startup news items and identify potential investment or business opportunities.
+
+For each item, determine:
+1. Is this a significant opportunity? (YES/NO)
+2. What type of opportunity? (funding round, new startup launch, market trend, technology breakthrough, partnership, acquisition, IPO, etc.)
+3. Key insights (3-4 punchy bullet points): What is this about? Why does it matter? What should people know?
+
+Content to analyze:
+{content_summary}
+
+Respond in JSON Lines format: exactly one JSON object per line, one line per item, in the same order as the sources, using "idx" for the source number. Do not wrap the lines in a list or code block.
+{{"idx": 1, "is_opportunity": true/false, "opportunity_type": "type", "explanation": "• Key point 1\\n• Key point 2\\n• Key point 3\\n• Key point 4"}}
+{{"idx": 2, ...}}"""
 
 
 def retry_on_failure(max_retries=3, delay=5, backoff=2):
@@ -91,6 +155,272 @@ def retry_on_failure(max_retries=3, delay=5, backoff=2):
     return decorator
 
 
+class TokenBucket:
+    """Async token-bucket rate limiter: bursts up to capacity, then refill_per_sec tokens per second"""
+    
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_sec)
+        self.updated = now
+    
+    async def acquire(self, tokens: float = 1) -> None:
+        """Take tokens from the bucket, sleeping only while it is empty"""
+        while True:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return
+            await asyncio.sleep((tokens - self.tokens) / self.refill_per_sec)
+    
+    def drain(self) -> None:
+        """Empty the bucket so the next request waits for a refill (used to back off after a 429)"""
+        self._refill()
+        self.tokens = 0
+
+
+# Re-titled cross-posts of one story land within this many bits of each other's 64-bit headline SimHash.
+# Kept tight: one changed verb in a short headline ("files for" vs "prices" an IPO) moves it by only a few bits
+SIMHASH_MAX_DISTANCE = 3
+# Headlines with fewer normalized words than this are too short to fingerprint reliably and skip the near-duplicate check
+SIMHASH_MIN_FEATURES = 5
+
+# Headline words that say nothing about which story it is
+_SIMHASH_STOP_WORDS = frozenset(
+    'a an the of in on for to and with by at as from its is are be has have after into over new'.split()
+)
+_SIMHASH_TOKEN_RE = re.compile(r'[\w.$€£]+')
+# "$50 million" and "$50M" are the same amount
+_AMOUNT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:(billion|bn)|(million|mn))\b', re.IGNORECASE)
+
+
+def _headline_features(title: str) -> Dict[str, int]:
+    """Normalized headline words, weighted so amounts and other numbers count double"""
+    title = _AMOUNT_RE.sub(lambda m: m.group(1) + ('b' if m.group(2) else 'm'), title)
+    features = {}
+    for raw in _SIMHASH_TOKEN_RE.findall(title):
+        raw = raw.strip('.')
+        word = raw.lower().lstrip('$€£')
+        if not any(c.isdigit() for c in word):
+            word = word.replace('.', '')  # U.S. -> us
+        if not word or word in _SIMHASH_STOP_WORDS:
+            continue
+        # Crude stemming so "raises"/"raised"/"raise" and "acquires"/"acquire" agree
+        if len(word) > 4 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        for suffix in ('ing', 'ed'):
+            if len(word) > 5 and word.endswith(suffix):
+                word = word[:-len(suffix)]
+                break
+        if len(word) > 4 and word.endswith('e'):
+            word = word[:-1]
+        weight = 2 if any(c.isdigit() for c in word) else 1
+        features[word] = max(features.get(word, 0), weight)
+    return features
+
+
+def simhash(title: str) -> Optional[int]:
+    """64-bit weighted SimHash of a headline, or None if it is too short to fingerprint reliably
+
+    >>> def near(a, b):
+    ...     fa, fb = simhash(a), simhash(b)
+    ...     return fa is not None and fb is not None and bin(fa ^ fb).count('1') <= SIMHASH_MAX_DISTANCE
+    >>> near('Groq raises $640M Series D led by BlackRock', 'Groq raises $640 million in Series D led by BlackRock')
+    True
+    >>> near('Mistral AI raises €600M in Series B funding', 'Mistral AI raised €600M Series B funding')
+    True
+    >>> near('Stripe acquires crypto startup Bridge for $1.1B', 'Stripe to acquire crypto startup Bridge for $1.1B')
+    True
+    >>> near('Mistral AI raises €600M in Series B funding', 'Mistral AI launches new coding model')
+    False
+    >>> near('Acme raises $50M Series B led by Sequoia', 'Acme raises $20M Series A led by Accel')
+    False
+    >>> near('Klarna files for US IPO at $15B valuation', 'Klarna prices US IPO at $15B valuation')
+    False
+    >>> near('Klarna files for US IPO', 'Klarna prices US IPO'), near('Klarna files for US IPO', 'Klarna withdraws US IPO')
+    (False, False)
+    >>> near('Stripe raises money', 'Stripe cuts staff'), near('Why founders fail', 'Why seed is broken')
+    (False, False)
+    >>> simhash(''), simhash('The new in of')
+    (None, None)
+    """
+    features = _headline_features(title)
+    if len(features) < SIMHASH_MIN_FEATURES:
+        return None
+    # Adjacent word pairs make a swapped verb or name move the fingerprint further than a dropped filler word does
+    words = list(features)
+    features.update((f'{first} {second}', 1) for first, second in zip(words, words[1:]))
+    weights = [0] * 64
+    for token, weight in features.items():
+        token_hash = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += weight if token_hash >> bit & 1 else -weight
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+class SimHashIndex:
+    """Banded index over 64-bit SimHashes, so near-duplicate lookups only compare fingerprints sharing a band"""
+    
+    # Two fingerprints within SIMHASH_MAX_DISTANCE bits must agree on at least one of MAX_DISTANCE + 1 bands
+    BANDS = SIMHASH_MAX_DISTANCE + 1
+    BAND_BITS = 64 // BANDS
+    
+    def __init__(self, fingerprints=()):
+        self._buckets: List[Dict[int, Set[int]]] = [{} for _ in range(self.BANDS)]
+        for fingerprint in fingerprints:
+            self.add(fingerprint)
+    
+    def _bands(self, fingerprint: int):
+        mask = (1 << self.BAND_BITS) - 1
+        for band in range(self.BANDS):
+            yield self._buckets[band], fingerprint >> (band * self.BAND_BITS) & mask
+    
+    def add(self, fingerprint: int) -> None:
+        for buckets, key in self._bands(fingerprint):
+            buckets.setdefault(key, set()).add(fingerprint)
+    
+    def discard(self, fingerprint: int) -> None:
+        for buckets, key in self._bands(fingerprint):
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.discard(fingerprint)
+                if not bucket:
+                    del buckets[key]
+    
+    def has_near_duplicate(self, fingerprint: int) -> bool:
+        """True if any indexed fingerprint is within SIMHASH_MAX_DISTANCE bits"""
+        for buckets, key in self._bands(fingerprint):
+            for other in buckets.get(key, ()):
+                if bin(fingerprint ^ other).count('1') <= SIMHASH_MAX_DISTANCE:
+                    return True
+        return False
+
+
+# Items must mention at least one of these (in title or summary) to be worth a Gemini call
+RELEVANCE_KEYWORDS_RE = re.compile(
+    r'\b(?:vcs?|venture|(?:pre-)?seed|series [a-f]|rais(?:e|es|ed|ing)|fund(?:s|ed|ing|raise|raising)?'
+    r'|rounds?|investors?|invest(?:s|ed|ing|ment|ments)?|valuation|startups?|founders?|unicorns?'
+    r'|acqui(?:re|res|red|sition|sitions)|mergers?|ipo|spac|backed|exits?|launch(?:es|ed)?)\b',
+    re.IGNORECASE
+)
+
+
+# Leading bytes of the image formats Telegram accepts as photos
+_IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+def sniff_image_type(body: bytes) -> Optional[str]:
+    """Identify an image from its first bytes, for origins that don't send an image/* Content-Type"""
+    for signature, content_type in _IMAGE_SIGNATURES:
+        if body.startswith(signature):
+            return content_type
+    if body[:4] == b'RIFF' and body[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+def _atom_text(elem) -> str:
+    """Text of an Atom text construct, keeping the child markup of type="xhtml" content that findtext would drop"""
+    if elem is None:
+        return ''
+    if elem.get('type') == 'xhtml':
+        return (elem.text or '') + ''.join(etree.tostring(child, encoding='unicode') for child in elem)
+    return elem.text or ''
+
+
+# Trailing commas before a closing brace/bracket - the most common way LLM JSON is malformed
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+
+def loads_lenient(text: str) -> Any:
+    """orjson.loads that retries once with trailing commas removed"""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return orjson.loads(_TRAILING_COMMA_RE.sub(r'\1', text))
+
+
+# Characters reserved by Telegram's MarkdownV2; substituted values escape all of them
+_MDV2_SPECIAL_RE = re.compile(r'([_*\[\]()~`>#+\-=|{}.!\\])')
+# Template text keeps its bold/italic/underline/code markup and escapes everything else
+_MDV2_TEMPLATE_TEXT_RE = re.compile(r'([\[\]()~>#+\-=|{}.!\\])')
+# A [text](url) link, matched with each placeholder stood in for by one private-use character
+_MDV2_LINK_RE = re.compile(r'\[[^\[\]]*\]\([^()]*\)')
+
+
+def escape_markdown_v2(value: Any) -> str:
+    """Escape a value so MarkdownV2 shows it literally"""
+    return _MDV2_SPECIAL_RE.sub(r'\\\1', str(value))
+
+
+def markdown_v2_template(template: str) -> str:
+    """Escape the literal text of a str.format template for MarkdownV2, keeping its markup, links and placeholders
+
+    >>> markdown_v2_template('*{title}* (beta) [Read more]({link}) [1]')
+    '*{title}* \\\\(beta\\\\) [Read more]({link}) \\\\[1\\\\]'
+    """
+    pieces = list(string.Formatter().parse(template))
+    # Brackets and parens that make up a [text](url) link stay unescaped
+    skeleton = ''.join(literal + ('\ue000' if field is not None else '') for literal, field, _, _ in pieces)
+    link_marks = set()
+    for match in _MDV2_LINK_RE.finditer(skeleton):
+        text_end = skeleton.index('](', match.start())
+        link_marks.update((match.start(), text_end, text_end + 1, match.end() - 1))
+    
+    parts = []
+    offset = 0
+    for literal, field, spec, conversion in pieces:
+        escaped = ''.join(
+            char if pos in link_marks else _MDV2_TEMPLATE_TEXT_RE.sub(r'\\\1', char)
+            for pos, char in enumerate(literal, offset)
+        )
+        parts.append(escaped.replace('{', '{{').replace('}', '}}'))
+        offset += len(literal)
+        if field is not None:
+            parts.append('{' + field + (f'!{conversion}' if conversion else '') + (f':{spec}' if spec else '') + '}')
+            offset += 1
+    return ''.join(parts)
+
+
+def markdown_v2_unbalanced(text: str) -> Optional[str]:
+    """The first bold/italic/code marker left open in MarkdownV2 text, or None if they are all closed
+
+    >>> markdown_v2_unbalanced('*Deal:* x'), markdown_v2_unbalanced('deal_flow *x*'), markdown_v2_unbalanced('a\\\\_b')
+    (None, '_', None)
+    """
+    unescaped = re.sub(r'\\.', '', text)
+    for marker in ('*', '_', '`'):
+        if unescaped.count(marker) % 2:
+            return marker
+    return None
+
+
+# Parsed JSON config files: path -> (modification time, data)
+_config_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def load_json_config(path: str) -> Any:
+    """Load a JSON config file, re-parsing it only when its modification time changes"""
+    mtime = os.path.getmtime(path)
+    cached = _config_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read())
+    _config_cache[path] = (mtime, data)
+    return data
+
+
 class VCNewsAnalyzer:
     def __init__(self):
         # API Keys - Set these as environment variables
@@ -98,10 +428,12 @@ class VCNewsAnalyzer:
         self.telegram_bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID')
         
-        # Configure Gemini
-        if self.gemini_api_key:
-            genai.configure(api_key=self.gemini_api_key)
-            self.model = genai.GenerativeModel('gemini-2.5-flash')
+        # Headless Chrome is heavy on a Raspberry Pi, so the Selenium image fallback is opt-in
+        self.selenium_enabled = os.getenv('ENABLE_SELENIUM_IMAGES', 'false').lower() in ('1', 'true', 'yes')
+        self._driver = None  # Started lazily and reused for the rest of the run
+        
+        # Shared HTTP session so feeds, article pages and Telegram reuse keep-alive connections
+        self.session = self._create_session()
         
         # RSS Feed URLs
         self.rss_feeds = {
@@ -120,52 +452,129 @@ class VCNewsAnalyzer:
             'Tank Talks': 'https://tanktalks.substack.com/feed'
         }
         
-        # History tracking file
-        self.history_file = 'sent_news_history.json'
-        self.sent_news_hashes = self._load_history()
+        # Feed URL -> (ETag, Last-Modified, parsed entries) from the last full fetch, for conditional GETs
+        self._feed_cache: Dict[str, Tuple[Optional[str], Optional[str], List[feedparser.FeedParserDict]]] = {}
+        
+        # History tracking: SQLite in WAL mode, so marking an item appends a row instead of rewriting a file
+        self.history_db_file = 'sent_news_history.db'
+        self.journal_history_file = 'sent_news_history.ndjson'  # Older formats, migrated on first start
+        self.legacy_history_file = 'sent_news_history.json'
+        self._history_lock = threading.Lock()
+        self._db = self._open_history_db()
+        self._simhash_index = SimHashIndex()
+        self._prune_history()
+        
+        # SimHash fingerprints are stored alongside the other hashes as 's:<hex>' rows and expire with them
+        with self._history_lock:
+            fingerprints = [int(h[2:], 16) for (h,) in self._db.execute("SELECT hash FROM seen WHERE hash LIKE 's:%'")]
+            history_count = self._db.execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+        self._simhash_index = SimHashIndex(fingerprints)
+        logger.info("📚 Loaded %s items from history", history_count)
         
         # Load prompt variations
         self.prompts = self._load_prompts()
         self.current_prompt_style = None  # Will be set during analysis
+        self._rng = random.Random()  # Own generator for style and post selection; seed it to reproduce a run
+        self.run_timestamp = time.strftime('%Y-%m-%d %H:%M:%S')  # Refreshed at the start of each run
+        
+        # Configure Gemini - one model per prompt style, so the fixed instructions form a
+        # stable prefix that Gemini can cache and only the news items vary per request
+        if self.gemini_api_key:
+            genai.configure(api_key=self.gemini_api_key)
+            self.model = self._create_model(DEFAULT_PROMPT)
+            self._rate_bucket = TokenBucket(GEMINI_BURST, GEMINI_REQUESTS_PER_MINUTE / 60)
+            # The async Gemini client binds its channel to the loop it first runs on, so every run
+            # reuses one loop (and its open connection) instead of asyncio.run creating a new one
+            self._loop = asyncio.new_event_loop()
+            self._style_models = {}
+            for style, data in self.prompts.items():
+                try:
+                    self._style_models[style] = self._create_model(data['prompt'])
+                except (KeyError, IndexError, ValueError) as e:
+                    logger.warning(f"Skipping invalid prompt style '{style}': {str(e)}")
         
         # Load message templates
         self.message_templates = self._load_message_templates()
+        
+        # Per-style lookups and Telegram endpoints are fixed for the lifetime of the bot
+        self._prompt_emojis = {style: data.get('emoji', '🚀') for style, data in self.prompts.items()}
+        # Templates are sent as MarkdownV2, so their literal text is escaped once here
+        self._default_message_template = markdown_v2_template(DEFAULT_MESSAGE_TEMPLATE)
+        self._templates_by_style = {}
+        for style, data in self.message_templates.items():
+            try:
+                if data.get('template'):
+                    template = markdown_v2_template(data['template'])
+                    # Render with placeholder values, so markup Telegram would reject falls back to the default now
+                    marker = markdown_v2_unbalanced(template.format_map(defaultdict(lambda: 'x')))
+                    if marker:
+                        raise ValueError(f"unclosed '{marker}' in MarkdownV2 markup")
+                    self._templates_by_style[style] = template
+            except ValueError as e:
+                logger.warning("Skipping invalid message template '%s': %s", style, e)
+        self._telegram_send_url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+        self._telegram_photo_url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendPhoto"
+        self._telegram_file_ids = {}  # image URL -> (Telegram file_id, uploaded at)
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session with keep-alive and retries on transient errors"""
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; VCNewsBot/1.0)'})
+        # Retry only idempotent requests (POSTs are excluded by default) so messages are never duplicated
+        retries = Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
+        # Telegram POSTs are safe to retry only when the message was certainly not accepted:
+        # connection failures and 429 rate limits (honouring Retry-After), never read errors or 5xx
+        telegram_retries = Retry(
+            total=3, read=0, backoff_factor=0.3, status_forcelist=[429],
+            allowed_methods=frozenset({'POST'}), respect_retry_after_header=True
+        )
+        session.mount('https://api.telegram.org/', HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=telegram_retries))
+        return session
+    
+    def _create_model(self, prompt_template: str) -> genai.GenerativeModel:
+        """Create a Gemini model whose system instruction is the prompt template minus the content"""
+        system_instruction = prompt_template.format(
+            content_summary="[The news items to analyze are provided in the user message.]"
+        )
+        return genai.GenerativeModel('gemini-2.5-flash', system_instruction=system_instruction)
     
     def _load_prompts(self) -> Dict[str, Dict[str, str]]:
         """Load prompt variations from prompts.json"""
         try:
-            with open('prompts.json', 'r') as f:
-                prompts = json.load(f)
-                print(f"📝 Loaded {len(prompts)} prompt variations")
-                return prompts
+            prompts = load_json_config('prompts.json')
+            logger.info("📝 Loaded %s prompt variations", len(prompts))
+            return prompts
         except FileNotFoundError:
-            print("⚠ prompts.json not found, using default prompt")
+            logger.warning("⚠ prompts.json not found, using default prompt")
             return {
                 "original": {
-                    "prompt": "Analyze the following VC and startup news items and identify potential investment or business opportunities.\n\nFor each item, determine:\n1. Is this a significant opportunity? (YES/NO)\n2. What type of opportunity? (funding round, new startup launch, market trend, technology breakthrough, partnership, acquisition, IPO, etc.)\n3. Key insights (3-4 punchy bullet points): What is this about? Why does it matter? What should people know?\n\nContent to analyze:\n{content_summary}\n\nRespond in JSON format for each item:\n{{\n    \"item_1\": {{\n        \"is_opportunity\": true/false,\n        \"opportunity_type\": \"type\",\n        \"explanation\": \"• Key point 1\\n• Key point 2\\n• Key point 3\\n• Key point 4\"\n    }},\n    ...\n}}",
+                    "prompt": DEFAULT_PROMPT,
                     "emoji": "🚀"
                 }
             }
         except Exception as e:
-            print(f"⚠ Error loading prompts: {str(e)}")
+            logger.warning("⚠ Error loading prompts: %s", e)
             return {}
     
     def _load_message_templates(self) -> Dict[str, Dict[str, str]]:
         """Load message templates from message_templates.json"""
         try:
-            with open('message_templates.json', 'r') as f:
-                templates = json.load(f)
-                print(f"💬 Loaded {len(templates)} message templates")
-                return templates
+            templates = load_json_config('message_templates.json')
+            logger.info("💬 Loaded %s message templates", len(templates))
+            return templates
         except FileNotFoundError:
-            print("⚠ message_templates.json not found, using default template")
+            logger.warning("⚠ message_templates.json not found, using default template")
             return {
                 "original": {
                     "template": "{emoji} *VC/Startup Opportunity Detected*\n\n*Source:* {source}\n*Title:* {title}\n\n*Type:* {opportunity_type}\n\n*Key Insights:*\n{explanation}\n\n*Link:* {link}\n\n_Analyzed at {timestamp}_\n_Style: {style}_"
                 }
             }
         except Exception as e:
-            print(f"⚠ Error loading message templates: {str(e)}")
+            logger.warning("⚠ Error loading message templates: %s", e)
             return {}
     
     def _generate_news_hash(self, item: Dict[str, Any]) -> str:
@@ -190,12 +599,11 @@ class VCNewsAnalyzer:
                     if enclosure.get('type', '').startswith('image/'):
                         return enclosure.get('href')
             
-            # Try to extract from summary/description HTML
-            if hasattr(entry, 'summary'):
-                soup = BeautifulSoup(entry.summary, 'html.parser')
-                img = soup.find('img')
-                if img and img.get('src'):
-                    return img.get('src')
+            # Try to extract from summary/description HTML (skip the parse when there is no <img>)
+            if hasattr(entry, 'summary') and '<img' in entry.summary:
+                srcs = lxml_html.fromstring(entry.summary).xpath('//img/@src')
+                if srcs and srcs[0]:
+                    return srcs[0]
             
             return None
         except Exception as e:
@@ -204,28 +612,26 @@ class VCNewsAnalyzer:
     def _fetch_image_from_article(self, url: str) -> Optional[str]:
         """Fetch image from article page (fallback method)"""
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (compatible; VCNewsBot/1.0)'}
-            response = requests.get(url, headers=headers, timeout=5)
+            response = self.session.get(url, timeout=5)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = lxml_html.fromstring(response.content)
             
             # Try Open Graph image
-            og_image = soup.find('meta', property='og:image')
-            if og_image and og_image.get('content'):
-                return og_image.get('content')
+            og_image = tree.xpath('//meta[@property="og:image"]/@content')
+            if og_image and og_image[0]:
+                return og_image[0]
             
             # Try Twitter card image
-            twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
-            if twitter_image and twitter_image.get('content'):
-                return twitter_image.get('content')
+            twitter_image = tree.xpath('//meta[@name="twitter:image"]/@content')
+            if twitter_image and twitter_image[0]:
+                return twitter_image[0]
             
             # Try first article image
-            article = soup.find('article')
-            if article:
-                img = article.find('img')
-                if img and img.get('src'):
-                    img_url = img.get('src')
+            article_images = tree.xpath('(//article)[1]//img/@src')
+            if article_images:
+                img_url = article_images[0]
+                if img_url:
                     # Handle relative URLs
                     if img_url.startswith('//'):
                         return 'https:' + img_url
@@ -239,25 +645,46 @@ class VCNewsAnalyzer:
         except Exception as e:
             return None
     
+    @cached_property
+    def _chrome_options(self) -> Options:
+        """Headless Chrome options, built once per analyzer"""
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-software-rasterizer")
+        chrome_options.add_argument("--single-process")  # Critical for Raspberry Pi
+        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
+        
+        # Set page load timeout to prevent hanging
+        chrome_options.page_load_strategy = 'eager'
+        return chrome_options
+    
+    def _get_or_create_driver(self) -> webdriver.Chrome:
+        """Return the shared headless Chrome driver, starting it on first use"""
+        if self._driver is None:
+            self._driver = webdriver.Chrome(options=self._chrome_options)
+            self._driver.set_page_load_timeout(15)  # 15 second timeout
+        return self._driver
+    
+    def _close_driver(self) -> None:
+        """Quit the shared Chrome driver, if one was started"""
+        # CRITICAL: Always close the driver to prevent memory leaks and chromedriver zombies
+        if self._driver:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logger.error(f"Error closing Selenium driver: {str(e)}")
+            finally:
+                self._driver = None
+    
     def _fetch_image_with_selenium(self, url: str) -> Optional[str]:
         """Fetch image from a page using Selenium to handle JavaScript rendering."""
-        driver = None
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-software-rasterizer")
-            chrome_options.add_argument("--single-process")  # Critical for Raspberry Pi
-            chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
-            
-            # Set page load timeout to prevent hanging
-            chrome_options.page_load_strategy = 'eager'
-
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.set_page_load_timeout(15)  # 15 second timeout
+            driver = self._get_or_create_driver()
+            driver.delete_all_cookies()  # Don't carry cookies from the previous site
             driver.get(url)
             
             # Wait for the main image or article body to be present
@@ -283,22 +710,27 @@ class VCNewsAnalyzer:
             
             return None
 
-        except (TimeoutException, WebDriverException) as e:
+        except TimeoutException as e:
+            logger.warning(f"Selenium scraping failed for {url}: {str(e)}")
+            return None
+        except WebDriverException as e:
+            # The browser may be wedged or dead - start a fresh one next time
             logger.warning(f"Selenium scraping failed for {url}: {str(e)}")
+            self._close_driver()
             return None
         except Exception as e:
             logger.error(f"Unexpected error in Selenium scraping for {url}: {str(e)}")
             return None
-        finally:
-            # CRITICAL: Always close the driver to prevent memory leaks
-            if driver:
-                try:
-                    driver.quit()
-                except Exception as e:
-                    logger.error(f"Error closing Selenium driver: {str(e)}")
 
-    def _normalize_url(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_url(url: str) -> str:
         """Normalize URL by removing query parameters and fragments"""
+        # Fast path for ordinary http(s) links: plain string splits instead of a urlparse round-trip
+        if url.startswith(('http://', 'https://')) and ';' not in url:
+            url = url.split('#', 1)[0].split('?', 1)[0]
+            return url.rstrip('/')
+        
         from urllib.parse import urlparse, urlunparse
         parsed = urlparse(url)
         # Keep only scheme, netloc, and path (remove query, fragment)
@@ -306,7 +738,7 @@ class VCNewsAnalyzer:
         # Remove trailing slash for consistency
         return normalized.rstrip('/')
     
-    def _generate_url_hash(self, item: Dict[str, Any]) -> str:
+    def _generate_url_hash(self, item: Dict[str, Any]) -> Optional[str]:
         """Generate a hash based only on the normalized URL"""
         url = item.get('link', '')
         if not url:
@@ -314,92 +746,255 @@ class VCNewsAnalyzer:
         normalized_url = self._normalize_url(url)
         return hashlib.md5(normalized_url.encode()).hexdigest()
     
-    def _load_history(self) -> Dict[str, float]:
-        """Load sent news history from JSON file"""
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, 'r') as f:
-                    history = json.load(f)
-                    # Clean up old entries (older than 7 days)
-                    current_time = time.time()
-                    cleaned_history = {
-                        hash_id: timestamp 
-                        for hash_id, timestamp in history.items()
-                        if current_time - timestamp < 7 * 24 * 60 * 60  # 7 days
-                    }
-                    print(f"📚 Loaded {len(cleaned_history)} items from history (cleaned {len(history) - len(cleaned_history)} old entries)")
-                    return cleaned_history
-            except Exception as e:
-                print(f"⚠ Error loading history: {str(e)}")
-                return {}
-        return {}
+    def _compute_hashes(self, item: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Return the (title+link, URL-only) hashes for an item, computing them once per item"""
+        hashes = item.get('_hashes')
+        if hashes is None:
+            hashes = (self._generate_news_hash(item), self._generate_url_hash(item))
+            item['_hashes'] = hashes
+        return hashes
+    
+    def _compute_simhash(self, item: Dict[str, Any]) -> Optional[int]:
+        """SimHash of the headline, computed once per item; summaries are left out because each outlet writes its own"""
+        if '_simhash' not in item:
+            item['_simhash'] = simhash(item.get('title', ''))
+        return item['_simhash']
+    
+    def _open_history_db(self) -> sqlite3.Connection:
+        """Open the history database in WAL mode, migrating an older history file on first use"""
+        # Fetch worker threads check for duplicates too, so the connection is shared under _history_lock
+        db = sqlite3.connect(self.history_db_file, isolation_level=None, check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.execute('CREATE TABLE IF NOT EXISTS seen(hash TEXT PRIMARY KEY, ts REAL NOT NULL)')
+        db.execute('CREATE INDEX IF NOT EXISTS seen_ts ON seen(ts)')
+        
+        if os.path.exists(self.journal_history_file):
+            self._migrate_history(db, self.journal_history_file)
+        elif os.path.exists(self.legacy_history_file):
+            self._migrate_history(db, self.legacy_history_file)
+        return db
     
-    def _save_history(self) -> None:
-        """Save sent news history to JSON file"""
+    def _migrate_history(self, db: sqlite3.Connection, old_file: str) -> None:
+        """Import an NDJSON journal or legacy single-JSON history file, then set it aside"""
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.sent_news_hashes, f, indent=2)
+            with open(old_file, 'rb') as f:
+                if old_file.endswith('.ndjson'):
+                    rows = []
+                    for line in f:
+                        try:
+                            entry = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue  # Torn line from an interrupted write
+                        rows.append((entry['h'], entry['t']))
+                else:
+                    rows = list(orjson.loads(f.read()).items())
+            with db:
+                db.execute('BEGIN')
+                db.executemany('INSERT OR REPLACE INTO seen VALUES(?, ?)', rows)
+            os.replace(old_file, old_file + '.migrated')
+            logger.info("📚 Migrated %s history entries from %s", len(rows), old_file)
         except Exception as e:
-            print(f"⚠ Error saving history: {str(e)}")
+            logger.warning("⚠ Error migrating history from %s: %s", old_file, e)
     
-    def _is_duplicate(self, item: Dict[str, Any]) -> bool:
-        """Check if a news item has already been analyzed (by title+link OR by URL)"""
-        # Check title+link hash
-        news_hash = self._generate_news_hash(item)
-        if news_hash in self.sent_news_hashes:
-            return True
+    def _prune_history(self) -> None:
+        """Delete history entries older than 7 days, dropping expired fingerprints from the SimHash index"""
+        cutoff = time.time() - HISTORY_RETENTION_SECONDS
+        try:
+            with self._history_lock:
+                for (hash_id,) in self._db.execute("SELECT hash FROM seen WHERE ts < ? AND hash LIKE 's:%'", (cutoff,)):
+                    self._simhash_index.discard(int(hash_id[2:], 16))
+                self._db.execute('DELETE FROM seen WHERE ts < ?', (cutoff,))
+        except sqlite3.Error as e:
+            logger.warning("⚠ Error pruning history: %s", e)
+    
+    def _resolve_article_image(self, opp: Dict[str, Any], scraped: Dict[str, Optional[str]]) -> Optional[str]:
+        """Scrape an image for an article without one in its feed, memoized in scraped per normalized URL"""
+        article_url = opp.get('link', '')
+        if not article_url:
+            return None
         
-        # Also check URL-only hash (catches same story from different sources)
-        url_hash = self._generate_url_hash(item)
-        if url_hash and url_hash in self.sent_news_hashes:
-            return True
+        cache_key = self._normalize_url(article_url)
+        if cache_key in scraped:
+            return scraped[cache_key]
         
-        return False
+        # First, try the fast, simple scraper
+        logger.info("ℹ No RSS image for '%.30s...'. Trying simple scrape.", opp['title'])
+        image_url = self._fetch_image_from_article(article_url)
+        
+        # If the simple scraper fails, optionally use the powerful (but slower) Selenium scraper
+        if not image_url and self.selenium_enabled:
+            logger.info("ℹ Simple scrape failed. Trying advanced scrape with Selenium...")
+            image_url = self._fetch_image_with_selenium(article_url)
+        
+        # Misses are memoized too, so a page without an image isn't scraped twice
+        scraped[cache_key] = image_url
+        return image_url
+    
+    def _is_duplicate(self, item: Dict[str, Any]) -> bool:
+        """Check if a news item has already been analyzed (by title+link OR by URL)"""
+        news_hash, url_hash = self._compute_hashes(item)
+        # Also check URL-only hash (catches same story from different sources); a None url_hash never matches
+        with self._history_lock:
+            row = self._db.execute('SELECT 1 FROM seen WHERE hash IN (?, ?) LIMIT 1', (news_hash, url_hash)).fetchone()
+        return row is not None
     
     def _mark_as_analyzed(self, item: Dict[str, Any]) -> None:
         """Mark a news item as analyzed (whether opportunity or not)"""
         # Store both title+link hash and URL-only hash
-        news_hash = self._generate_news_hash(item)
-        self.sent_news_hashes[news_hash] = time.time()
+        news_hash, url_hash = self._compute_hashes(item)
+        now = time.time()
+        hashes = [news_hash]
         
         # Also store URL hash to catch same story from different sources
-        url_hash = self._generate_url_hash(item)
         if url_hash:
-            self.sent_news_hashes[url_hash] = time.time()
+            hashes.append(url_hash)
+        
+        # And the SimHash, to catch the same story re-titled by another outlet
+        fingerprint = self._compute_simhash(item)
+        if fingerprint is not None:
+            hashes.append(f's:{fingerprint:016x}')
+            self._simhash_index.add(fingerprint)
+        
+        try:
+            with self._history_lock:
+                self._db.executemany('INSERT OR IGNORE INTO seen VALUES(?, ?)', [(h, now) for h in hashes])
+        except sqlite3.Error as e:
+            logger.warning("⚠ Error saving history: %s", e)
+    
+    def _parse_feed_fast(self, body: bytes) -> List[feedparser.FeedParserDict]:
+        """Stream-parse RSS/Atom items with lxml, returning [] if the feed needs feedparser instead"""
+        entries = []
+        try:
+            for _, elem in etree.iterparse(
+                io.BytesIO(body), events=('end',), resolve_entities=False,
+                tag=('item', RSS1_NS + 'item', ATOM_NS + 'entry')
+            ):
+                if elem.tag == ATOM_NS + 'entry':
+                    ns = ATOM_NS
+                    link = ''
+                    for link_elem in elem.iterfind(ATOM_NS + 'link'):
+                        if link_elem.get('rel', 'alternate') == 'alternate':
+                            link = link_elem.get('href', '')
+                            break
+                    summary = _atom_text(elem.find(ATOM_NS + 'summary')) or _atom_text(elem.find(ATOM_NS + 'content'))
+                    published = elem.findtext(ATOM_NS + 'published') or elem.findtext(ATOM_NS + 'updated') or ''
+                else:
+                    ns = RSS1_NS if elem.tag == RSS1_NS + 'item' else ''
+                    link = elem.findtext(ns + 'link') or ''
+                    summary = elem.findtext(ns + 'description') or ''
+                    published = elem.findtext('pubDate') or elem.findtext(DC_NS + 'date') or ''
+                
+                entry = feedparser.FeedParserDict(
+                    title=html.unescape((elem.findtext(ns + 'title') or '').strip()),
+                    link=link.strip(),
+                    summary=summary,
+                    published=published.strip()
+                )
+                # Image candidates are cheap attribute reads; summary <img> parsing is left to _extract_image_from_entry
+                media_content = [{'url': m.get('url')} for m in elem.iter(MEDIA_NS + 'content') if m.get('url')]
+                if media_content:
+                    entry['media_content'] = media_content
+                media_thumbnail = [{'url': m.get('url')} for m in elem.iter(MEDIA_NS + 'thumbnail') if m.get('url')]
+                if media_thumbnail:
+                    entry['media_thumbnail'] = media_thumbnail
+                # FeedParserDict derives entry.enclosures from rel="enclosure" links, so store them as links
+                enclosures = [
+                    {'rel': 'enclosure', 'href': e.get('url', ''), 'type': e.get('type', '')}
+                    for e in elem.iterfind('enclosure')
+                ] + [
+                    {'rel': 'enclosure', 'href': e.get('href', ''), 'type': e.get('type', '')}
+                    for e in elem.iterfind(ATOM_NS + 'link') if e.get('rel') == 'enclosure'
+                ]
+                if enclosures:
+                    entry['links'] = enclosures
+                entries.append(entry)
+                
+                # Free parsed items as we go to keep memory flat
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+                
+                if len(entries) >= MAX_ENTRIES_PER_FEED:
+                    break
+        except etree.XMLSyntaxError:
+            return []
+        
+        # Entries without a title or link would need feedparser's heuristics
+        if any(not entry.title or not entry.link for entry in entries):
+            return []
+        return entries
+    
+    def _parse_feed_body(self, source_name: str, body: bytes) -> List[feedparser.FeedParserDict]:
+        """Parse a feed body into its newest entries, falling back to feedparser for unusual feeds"""
+        entries = self._parse_feed_fast(body)
+        if entries:
+            return entries
+        
+        # Malformed or unusual feed - let feedparser's forgiving parser handle it.
+        # Only titles, links, image URLs and short summary prefixes are used, so skip
+        # feedparser's per-entry HTML sanitizer and relative-URI rewriting
+        feed = feedparser.parse(body, resolve_relative_uris=False, sanitize_html=False)
+        
+        # Debug: Check if feed has errors
+        if hasattr(feed, 'bozo') and feed.bozo:
+            logger.warning(f"Feed parsing warning for {source_name}: {feed.get('bozo_exception', 'Unknown error')}")
         
+        # Debug: Check total entries available
+        if len(feed.entries) == 0:
+            logger.warning(f"No entries found in {source_name} feed. Status: {feed.get('status', 'N/A')}")
+        return feed.entries[:MAX_ENTRIES_PER_FEED]
+    
     def _fetch_single_feed(self, source_name: str, feed_url: str) -> List[Dict[str, Any]]:
         """Fetch a single RSS feed with timeout protection"""
         articles = []
         
         try:
+            # Conditional GET: an unchanged feed answers 304 without a body, and the entries
+            # parsed last time are replayed so unposted items stay candidates
+            cached = self._feed_cache.get(feed_url)
+            headers = {}
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
             # Always fetch with requests first to have better timeout control
-            headers = {'User-Agent': 'Mozilla/5.0 (compatible; VCNewsBot/1.0)'}
-            response = requests.get(feed_url, headers=headers, timeout=15, allow_redirects=True)
+            response = self.session.get(feed_url, timeout=15, allow_redirects=True, headers=headers)
             response.raise_for_status()
-            feed = feedparser.parse(response.content)
-            
-            # Debug: Check if feed has errors
-            if hasattr(feed, 'bozo') and feed.bozo:
-                logger.warning(f"Feed parsing warning for {source_name}: {feed.get('bozo_exception', 'Unknown error')}")
-            
-            # Debug: Check total entries available
-            if len(feed.entries) == 0:
-                logger.warning(f"No entries found in {source_name} feed. Status: {feed.get('status', 'N/A')}")
-                return articles
+            unchanged = response.status_code == 304 and cached is not None
+            if unchanged:
+                entries = cached[2]
+            else:
+                entries = self._parse_feed_body(source_name, response.content)
+                etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    self._feed_cache[feed_url] = (etag, last_modified, entries)
+                else:
+                    self._feed_cache.pop(feed_url, None)
             
-            for entry in feed.entries[:10]:  # Limit to 10 most recent
-                article = {
+            skipped = 0
+            for entry in entries:
+                # Check history first so already-posted entries skip image extraction entirely
+                article = {'title': entry.title, 'link': entry.link}
+                if self._is_duplicate(article):
+                    skipped += 1
+                    continue
+                
+                summary = entry.get('summary', '')
+                article.update({
                     'source': source_name,
-                    'title': entry.title,
-                    'link': entry.link,
-                    'summary': entry.get('summary', ''),
+                    'summary': summary,
+                    '_summary_short': summary[:500],
                     'image_url': self._extract_image_from_entry(entry),
                     'published': entry.get('published', ''),
                     'type': 'rss'
-                }
+                })
                 articles.append(article)
             
-            logger.info(f"✓ Fetched {len(articles)} articles from {source_name}")
+            logger.info(f"✓ Fetched {len(articles)} new articles from {source_name} ({skipped} already posted{', feed unchanged' if unchanged else ''})")
             
         except requests.Timeout:
             logger.error(f"Timeout fetching {source_name} (15s limit exceeded)")
@@ -411,14 +1006,22 @@ class VCNewsAnalyzer:
     def fetch_rss_feeds(self) -> List[Dict[str, Any]]:
         """Fetch articles from all RSS feeds"""
         all_articles = []
+        if not self.rss_feeds:
+            return all_articles
         
-        for source_name, feed_url in self.rss_feeds.items():
-            try:
-                logger.info(f"Fetching RSS feed from {source_name}...")
-                articles = self._fetch_single_feed(source_name, feed_url)
-                all_articles.extend(articles)
-            except Exception as e:
-                logger.error(f"Unexpected error with {source_name}: {str(e)}", exc_info=True)
+        # Feeds are fetched concurrently - each fetch is network-bound and keeps its own timeout
+        logger.info(f"Fetching {len(self.rss_feeds)} RSS feeds...")
+        with ThreadPoolExecutor(max_workers=min(16, len(self.rss_feeds))) as executor:
+            futures = {
+                executor.submit(self._fetch_single_feed, source_name, feed_url): source_name
+                for source_name, feed_url in self.rss_feeds.items()
+            }
+            for future in as_completed(futures):
+                source_name = futures[future]
+                try:
+                    all_articles.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Unexpected error with {source_name}: {str(e)}", exc_info=True)
         
         return all_articles
     
@@ -441,106 +1044,156 @@ class VCNewsAnalyzer:
             return []
         
         # Select a random prompt style for this run
-        if self.prompts:
-            prompt_key = random.choice(list(self.prompts.keys()))
+        if self._style_models:
+            prompt_key = self._rng.choice(list(self._style_models.keys()))
             prompt_data = self.prompts[prompt_key]
-            prompt_template = prompt_data['prompt']
+            model = self._style_models[prompt_key]
             prompt_emoji = prompt_data['emoji']
             self.current_prompt_style = prompt_key
             logger.info(f"Analyzing with '{prompt_key}' style {prompt_emoji}...")
         else:
             logger.info("Analyzing content with Google Gemini 2.5 Flash...")
-            prompt_template = None
+            model = self.model
         
         analyzed_items = []
         
-        # Batch items for analysis (process in groups)
-        batch_size = 5
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i+batch_size]
-            
-            # Prepare content for analysis
-            content_summary = "\n\n".join([
-                f"Source {idx+1} ({item['source']}):\n"
-                f"Title: {item['title']}\n"
-                f"Summary: {item.get('summary', '')[:500]}"
-                for idx, item in enumerate(batch)
-            ])
-            
-            # Use selected prompt template or default
-            if prompt_template:
-                prompt = prompt_template.format(content_summary=content_summary)
-            else:
-                # Fallback to original prompt
-                prompt = f"""Analyze the following VC and startup news items and identify potential investment or business opportunities.
-
-For each item, determine:
-1. Is this a significant opportunity? (YES/NO)
-2. What type of opportunity? (funding round, new startup launch, market trend, technology breakthrough, partnership, acquisition, IPO, etc.)
-3. Key insights (3-4 punchy bullet points): What is this about? Why does it matter? What should people know?
-
-Content to analyze:
-{content_summary}
-
-Respond in JSON format for each item:
-{{
-    "item_1": {{
-        "is_opportunity": true/false,
-        "opportunity_type": "type",
-        "explanation": "• Key point 1\\n• Key point 2\\n• Key point 3\\n• Key point 4"
-    }},
-    ...
-}}"""
+        # Pack many items into each request - fewer round-trips and less repeated prompt overhead
+        batch_size = GEMINI_ITEMS_PER_REQUEST
+        batches = [items[i:i+batch_size] for i in range(0, len(items), batch_size)]
+        # Only the news items are sent per request; the instructions live in the model's system instruction
+        contents = [self._format_batch_content(batch) for batch in batches]
+        
+        # Batches are independent, so they are sent to Gemini concurrently
+        responses = self._loop.run_until_complete(self._generate_batch_responses(model, contents))
+        
+        for batch_number, (batch, analysis) in enumerate(zip(batches, responses), 1):
+            if analysis is None:
+                analysis = {}
+            elif not analysis:
+                logger.warning(f"Could not parse any analysis lines for batch {batch_number}")
             
-            try:
-                response = self.model.generate_content(prompt)
-                
-                # Parse the response
-                response_text = response.text.strip()
-                
-                # Try to extract JSON from the response
-                if "```json" in response_text:
-                    response_text = response_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in response_text:
-                    response_text = response_text.split("```")[1].split("```")[0].strip()
-                
-                try:
-                    analysis = json.loads(response_text)
-                    
-                    # Match analysis results with items
-                    for idx, item in enumerate(batch):
-                        item_key = f"item_{idx+1}"
-                        if item_key in analysis:
-                            item_analysis = analysis[item_key]
-                            item['ai_analysis'] = item_analysis
-                            item['is_opportunity'] = item_analysis.get('is_opportunity', False)
-                            analyzed_items.append(item)
-                        else:
-                            item['ai_analysis'] = None
-                            item['is_opportunity'] = False
-                            analyzed_items.append(item)
-                    
-                except json.JSONDecodeError:
-                    logger.warning(f"Could not parse JSON response for batch {i//batch_size + 1}")
-                    # Add items without analysis
-                    for item in batch:
-                        item['ai_analysis'] = {'explanation': response_text[:200]}
-                        item['is_opportunity'] = False
-                        analyzed_items.append(item)
-                
-                # Rate limiting - be nice to the API
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error analyzing batch {i//batch_size + 1}: {str(e)}", exc_info=True)
-                # Add items without analysis
-                for item in batch:
-                    item['ai_analysis'] = None
-                    item['is_opportunity'] = False
-                    analyzed_items.append(item)
+            # Match analysis results with items by their 1-based source number
+            for idx, item in enumerate(batch, 1):
+                item_analysis = analysis.get(idx)
+                item['ai_analysis'] = item_analysis
+                item['is_opportunity'] = bool(item_analysis and item_analysis.get('is_opportunity', False))
+                analyzed_items.append(item)
         
         return analyzed_items
     
+    def _format_batch_content(self, batch: List[Dict[str, Any]]) -> str:
+        """Render a batch of items as the numbered source list sent to Gemini"""
+        return "\n\n".join(
+            f"Source {idx} ({item['source']}):\nTitle: {item['title']}\nSummary: {self._summary_short(item)}"
+            for idx, item in enumerate(batch, 1)
+        )
+    
+    def _summary_short(self, item: Dict[str, Any]) -> str:
+        """Return the first 500 characters of an item's summary, truncating it only once per item"""
+        summary_short = item.get('_summary_short')
+        if summary_short is None:
+            summary_short = item['_summary_short'] = item.get('summary', '')[:500]
+        return summary_short
+    
+    def _parse_analysis_line(self, line: str, results: Dict[int, Dict[str, Any]]) -> None:
+        """Parse one JSON Lines record from Gemini into results, keyed by its source number"""
+        # Tolerate records written as JSON array elements ("[{...},")
+        line = line.strip().lstrip('[').rstrip(',]').strip()
+        if not line.startswith('{'):
+            return  # Code fences, blank lines and any chatter around the records
+        try:
+            self._add_analysis_record(loads_lenient(line), results)
+        except ValueError:
+            logger.debug(f"Skipping unparseable analysis line: {line[:100]}")
+    
+    def _add_analysis_record(self, entry: Any, results: Dict[int, Dict[str, Any]]) -> None:
+        """Store a parsed record under its source number ("idx", or "id" as models sometimes write)"""
+        if not isinstance(entry, dict):
+            return
+        idx = entry.get('idx', entry.get('id'))
+        try:
+            results[int(idx)] = entry
+        except (TypeError, ValueError):
+            pass
+    
+    def _parse_legacy_analysis(self, response_text: str) -> Dict[int, Dict[str, Any]]:
+        """Parse a whole-response JSON array of records or {"item_1": {...}} object (older custom prompts)"""
+        # Try to extract JSON from the response
+        if "```json" in response_text:
+            response_text = response_text.split("```json")[1].split("```")[0].strip()
+        elif "```" in response_text:
+            response_text = response_text.split("```")[1].split("```")[0].strip()
+        try:
+            analysis = loads_lenient(response_text)
+        except ValueError:
+            return {}
+        if isinstance(analysis, list):
+            results = {}
+            for entry in analysis:
+                self._add_analysis_record(entry, results)
+            return results
+        if not isinstance(analysis, dict):
+            return {}
+        return {
+            int(key[len('item_'):]): value
+            for key, value in analysis.items()
+            if key.startswith('item_') and key[len('item_'):].isdigit() and isinstance(value, dict)
+        }
+    
+    async def _generate_batch_responses(
+        self, model: genai.GenerativeModel, contents: List[str]
+    ) -> List[Optional[Dict[int, Dict[str, Any]]]]:
+        """Send all batches to Gemini concurrently; failed batches yield None"""
+        semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+        
+        async def generate(batch_number: int, content: str) -> Optional[Dict[int, Dict[str, Any]]]:
+            async with semaphore:
+                for attempt in range(1, 4):
+                    await self._rate_bucket.acquire()
+                    try:
+                        return await self._stream_batch_analysis(model, content)
+                    except google_exceptions.ResourceExhausted:
+                        # Only back off when Gemini actually rate-limits us
+                        logger.warning(f"Gemini rate limit hit for batch {batch_number} (attempt {attempt}/3)")
+                        self._rate_bucket.drain()
+                    except Exception as e:
+                        logger.error(f"Error analyzing batch {batch_number}: {str(e)}", exc_info=True)
+                        return None
+                return None
+        
+        return await asyncio.gather(*[generate(n, content) for n, content in enumerate(contents, 1)])
+    
+    async def _stream_batch_analysis(self, model: genai.GenerativeModel, content: str) -> Dict[int, Dict[str, Any]]:
+        """Stream a Gemini response and parse each JSON line as soon as it arrives"""
+        results = {}
+        chunks = []
+        pending = ''
+        response = await model.generate_content_async(
+            content, stream=True, request_options={'timeout': GEMINI_REQUEST_TIMEOUT}
+        )
+        try:
+            async for chunk in response:
+                # A chunk without parts (e.g. the final one carrying only the finish reason) has no text
+                if not chunk.parts:
+                    continue
+                chunks.append(chunk.text)
+                pending += chunk.text
+                *complete_lines, pending = pending.split('\n')
+                for line in complete_lines:
+                    self._parse_analysis_line(line, results)
+        except Exception as e:
+            if not results:
+                raise
+            # Keep the records that already arrived rather than losing the whole batch
+            logger.warning(f"Gemini stream failed after {len(results)} record(s), keeping them: {str(e)}")
+            return results
+        self._parse_analysis_line(pending, results)
+        
+        if not results:
+            # The model (or a customised prompt) may have answered with a single JSON object instead
+            results = self._parse_legacy_analysis(''.join(chunks).strip())
+        return results
+    
     def filter_opportunities(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter items to only include identified opportunities"""
         opportunities = [item for item in items if item.get('is_opportunity', False)]
@@ -549,177 +1202,226 @@ Respond in JSON format for each item:
         return opportunities
     
     def filter_duplicates(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter out previously analyzed items (opportunities AND non-opportunities)"""
+        """Filter out previously analyzed items (opportunities AND non-opportunities) and near-duplicate stories"""
         new_items = []
         duplicate_count = 0
+        near_duplicate_count = 0
+        run_index = SimHashIndex()  # Items kept so far this run, so cross-posts within one fetch are caught too
         
         for item in items:
-            if not self._is_duplicate(item):
-                new_items.append(item)
-            else:
+            if self._is_duplicate(item):
                 duplicate_count += 1
+                continue
+            fingerprint = self._compute_simhash(item)
+            if fingerprint is not None:
+                if self._simhash_index.has_near_duplicate(fingerprint) or run_index.has_near_duplicate(fingerprint):
+                    near_duplicate_count += 1
+                    logger.info("🔁 Skipping near-duplicate: %s", item.get('title', ''))
+                    continue
+                run_index.add(fingerprint)
+            new_items.append(item)
         
-        logger.info(f"Filtered out {duplicate_count} already-analyzed item(s), {len(new_items)} new items to analyze")
+        logger.info(f"Filtered out {duplicate_count} already-analyzed and {near_duplicate_count} near-duplicate item(s), {len(new_items)} new items to analyze")
         return new_items
     
+    def filter_relevant(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop items that mention no VC/startup keyword, so Gemini is only paid for plausible candidates"""
+        candidates = [
+            item for item in items
+            if RELEVANCE_KEYWORDS_RE.search(item.get('title', '')) or RELEVANCE_KEYWORDS_RE.search(self._summary_short(item))
+        ]
+        logger.info(f"Keyword prefilter dropped {len(items) - len(candidates)} item(s), {len(candidates)} left to analyze")
+        return candidates
+    
+    def _post_telegram(self, url: str, payload: Dict[str, Any]) -> None:
+        """POST to the Telegram API when only the status matters"""
+        # The small body is read (not streamed) so the keep-alive connection goes back to the pool
+        response = self.session.post(url, json=payload, timeout=10)
+        response.raise_for_status()
+    
+    def _download_image(self, image_url: str) -> Optional[Tuple[bytes, str]]:
+        """Download an image for upload, returning (body, content type) or None if it isn't a recognized image; raises if it is too big"""
+        with self.session.get(image_url, timeout=IMAGE_DOWNLOAD_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            if int(response.headers.get('Content-Length') or 0) > IMAGE_DOWNLOAD_MAX_BYTES:
+                raise ValueError("image is larger than 5 MB")
+            
+            body = bytearray()
+            for chunk in response.iter_content(64 * 1024):
+                body += chunk
+                if len(body) > IMAGE_DOWNLOAD_MAX_BYTES:
+                    raise ValueError("image is larger than 5 MB")
+        
+        if not content_type.startswith('image/'):
+            # CDNs and S3 buckets often send application/octet-stream, so trust the bytes instead
+            content_type = sniff_image_type(body)
+            if content_type is None:
+                return None
+        return bytes(body), content_type
+    
+    def _send_photo(self, image_url: str, caption: Optional[str] = None) -> None:
+        """Send a photo, reusing Telegram's file_id if this image was uploaded before"""
+        cached = self._telegram_file_ids.get(image_url)
+        file_id = cached[0] if cached and time.time() - cached[1] < TELEGRAM_FILE_ID_TTL_SECONDS else None
+        
+        fields = {'chat_id': self.telegram_chat_id}
+        if caption:
+            fields['caption'] = caption
+            fields['parse_mode'] = 'MarkdownV2'
+        
+        if file_id:
+            response = self.session.post(self._telegram_photo_url, json={**fields, 'photo': file_id}, timeout=10)
+            if not response.ok:
+                self._telegram_file_ids.pop(image_url, None)  # Stale file_id, upload the image next time
+            response.raise_for_status()
+            return
+        
+        # Upload the bytes rather than passing the URL, so Telegram doesn't have to fetch it from the origin
+        image = self._download_image(image_url)
+        if image:
+            body, content_type = image
+            extension = content_type.split('/')[-1].split('+')[0]
+            files = {'photo': (f'photo.{extension}', body, content_type)}
+            response = self.session.post(self._telegram_photo_url, data=fields, files=files, timeout=30)
+        else:
+            # Not a format we recognize - let Telegram fetch the URL and decide, as before uploads
+            logger.info("ℹ Unrecognized image type, letting Telegram fetch %s", image_url)
+            response = self.session.post(self._telegram_photo_url, json={**fields, 'photo': image_url}, timeout=30)
+        response.raise_for_status()
+        try:
+            # Telegram returns several sizes; the last one is the original
+            new_file_id = response.json()['result']['photo'][-1]['file_id']
+            self._telegram_file_ids[image_url] = (new_file_id, time.time())
+        except (ValueError, KeyError, IndexError, TypeError):
+            pass
+    
     def send_to_telegram(self, opportunities: List[Dict[str, Any]]) -> None:
         """Send opportunities to Telegram"""
         if not self.telegram_bot_token or not self.telegram_chat_id:
-            print("⚠ Telegram credentials not set, skipping notification")
-            print("\n📋 Opportunities found:")
+            logger.warning("⚠ Telegram credentials not set, skipping notification")
+            logger.info("📋 Opportunities found:")
             for idx, opp in enumerate(opportunities, 1):
-                print(f"\n{idx}. {opp['title']}")
-                print(f"   Source: {opp['source']}")
+                logger.info("%s. %s", idx, opp['title'])
+                logger.info("   Source: %s", opp['source'])
                 if opp.get('ai_analysis'):
-                    print(f"   Analysis: {opp['ai_analysis'].get('explanation', 'N/A')}")
+                    logger.info("   Analysis: %s", opp['ai_analysis'].get('explanation', 'N/A'))
             return
         
         if not opportunities:
-            print("ℹ No opportunities to send")
+            logger.info("ℹ No opportunities to send")
             return
         
-        print(f"\n📱 Sending {len(opportunities)} opportunities to Telegram...")
+        logger.info("📱 Sending %s opportunities to Telegram...", len(opportunities))
+        
+        # If no image in RSS, try fetching from the article URL. This runs first and one at a
+        # time because the shared Selenium driver is not thread-safe.
+        # Posted URLs are recorded in history, so a memo only pays off within this run (same story selected twice)
+        scraped = {}
+        image_urls = [opp.get('image_url') or self._resolve_article_image(opp, scraped) for opp in opportunities]
         
-        telegram_api = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+        # Each post is independent network I/O on the pooled session, so they go out concurrently
+        with ThreadPoolExecutor(max_workers=len(opportunities)) as executor:
+            list(executor.map(self._send_opportunity, opportunities, image_urls))
+    
+    def _format_message(self, opp: Dict[str, Any]) -> str:
+        """Render an opportunity's Telegram message from the current style's template, or the default format"""
+        analysis = opp.get('ai_analysis', {})
         
-        for opp in opportunities:
+        # Get prompt emoji and template
+        style = self.current_prompt_style or 'original'
+        template = self._templates_by_style.get(style)
+        
+        # Substituted values are escaped so titles and AI text can't break the MarkdownV2 markup
+        values = {
+            'emoji': self._prompt_emojis.get(style, '🚀'),
+            'source': opp['source'],
+            'title': opp['title'],
+            'opportunity_type': analysis.get('opportunity_type', 'N/A'),
+            'explanation': analysis.get('explanation', 'No analysis available'),
+            'link': opp.get('link', 'N/A'),
+            'timestamp': self.run_timestamp,
+            'style': style
+        }
+        values = {key: escape_markdown_v2(value) for key, value in values.items()}
+        
+        # Format message with template or use default
+        if template:
             try:
-                # Format message using template
-                analysis = opp.get('ai_analysis', {})
-                
-                # Get prompt emoji and template
-                style = self.current_prompt_style or 'original'
-                prompt_emoji = '🚀'
-                template = None
-                
-                if self.prompts and style in self.prompts:
-                    prompt_emoji = self.prompts[style].get('emoji', '🚀')
-                
-                if self.message_templates and style in self.message_templates:
-                    template = self.message_templates[style].get('template')
-                
-                # Format message with template or use default
-                if template:
+                return template.format(**values)
+            except Exception as template_error:
+                logger.warning("⚠ Template formatting failed: %s, using default...", template_error)
+        
+        return self._default_message_template.format(**values)
+    
+    def _send_opportunity(self, opp: Dict[str, Any], image_url: Optional[str]) -> None:
+        """Send a single opportunity, with its image when one is available"""
+        try:
+            # Messages are normally rendered in run_workflow, before any sending starts
+            message = opp.get('_msg') or self._format_message(opp)
+            
+            # Send with image if available, otherwise text only
+            sent_successfully = False
+            if image_url:
+                # Check if message exceeds Telegram's caption limit (1024 chars)
+                if len(message) > 1024:
+                    logger.info("ℹ Message is too long for a caption. Sending image and text separately.")
                     try:
-                        message = template.format(
-                            emoji=prompt_emoji,
-                            source=opp['source'],
-                            title=opp['title'],
-                            opportunity_type=analysis.get('opportunity_type', 'N/A'),
-                            explanation=analysis.get('explanation', 'No analysis available'),
-                            link=opp.get('link', 'N/A'),
-                            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            style=style
-                        )
-                    except Exception as template_error:
-                        print(f"⚠ Template formatting failed: {str(template_error)}, using default...")
-                        template = None
+                        # Send the photo without a caption
+                        self._send_photo(image_url)
+                        # The text will be sent in the 'if not sent_successfully' block below
+                    except Exception as img_error:
+                        logger.warning("⚠ Image failed to send separately (%s). Proceeding with text only.", img_error)
                 else:
-                    # Fallback to default format
-                    message = f"""
-{prompt_emoji} *VC/Startup Opportunity Detected*
-
-*Source:* {opp['source']}
-*Title:* {opp['title']}
-
-*Type:* {analysis.get('opportunity_type', 'N/A')}
-
-*Key Insights:*
-{analysis.get('explanation', 'No analysis available')}
-
-*Link:* {opp.get('link', 'N/A')}
-
-_Analyzed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}_
-_Style: {style}_
-"""
-                
-                # Try to get image URL
-                image_url = opp.get('image_url')
-                
-                # If no image in RSS, try fetching from the article URL
-                if not image_url:
-                    article_url = opp.get('link', '')
-                    if article_url:
-                        # First, try the fast, simple scraper
-                        print(f"ℹ No RSS image for '{opp['title'][:30]}...'. Trying simple scrape.")
-                        image_url = self._fetch_image_from_article(article_url)
-                        
-                        # If the simple scraper fails, use the powerful (but slower) Selenium scraper
-                        if not image_url:
-                            print(f"ℹ Simple scrape failed. Trying advanced scrape with Selenium...")
-                            image_url = self._fetch_image_with_selenium(article_url)
-                
-                # Send with image if available, otherwise text only
-                sent_successfully = False
-                if image_url:
-                    # Check if message exceeds Telegram's caption limit (1024 chars)
-                    if len(message) > 1024:
-                        print("ℹ Message is too long for a caption. Sending image and text separately.")
-                        try:
-                            # Send the photo without a caption
-                            photo_api = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendPhoto"
-                            photo_payload = {'chat_id': self.telegram_chat_id, 'photo': image_url}
-                            photo_response = requests.post(photo_api, json=photo_payload, timeout=10)
-                            photo_response.raise_for_status()
-                            # The text will be sent in the 'if not sent_successfully' block below
-                        except Exception as img_error:
-                            print(f"⚠ Image failed to send separately ({str(img_error)}). Proceeding with text only.")
-                    else:
-                        # Message is short enough for a caption
-                        try:
-                            photo_api = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendPhoto"
-                            payload = {
-                                'chat_id': self.telegram_chat_id,
-                                'photo': image_url,
-                                'caption': message,
-                                'parse_mode': 'Markdown'
-                            }
-                            response = requests.post(photo_api, json=payload, timeout=10)
-                            response.raise_for_status()
-                            sent_successfully = True
-                        except Exception as img_error:
-                            print(f"⚠ Image with caption failed ({str(img_error)}), sending as text...")
-                
-                # If no image or image failed, send as text
-                if not sent_successfully:
-                    # Try with Markdown first, fallback to plain text if it fails
-                    payload = {
-                        'chat_id': self.telegram_chat_id,
-                        'text': message,
-                        'parse_mode': 'Markdown',
-                        'disable_web_page_preview': True
-                    }
+                    # Message is short enough for a caption
                     try:
-                        response = requests.post(telegram_api, json=payload, timeout=10)
-                        response.raise_for_status()
-                    except Exception as markdown_error:
-                        # If Markdown fails, try without parse_mode (plain text)
-                        print(f"⚠ Markdown failed, sending as plain text...")
-                        payload = {
-                            'chat_id': self.telegram_chat_id,
-                            'text': message.replace('*', '').replace('_', ''),  # Remove markdown formatting
-                            'disable_web_page_preview': True
-                        }
-                        response = requests.post(telegram_api, json=payload, timeout=10)
-                        response.raise_for_status()
-                
-                print(f"✓ Sent: {opp['title'][:50]}...")
-                time.sleep(1)  # Rate limiting
-                
-            except Exception as e:
-                print(f"✗ Error sending to Telegram: {str(e)}")
+                        self._send_photo(image_url, caption=message)
+                        sent_successfully = True
+                    except Exception as img_error:
+                        logger.warning("⚠ Image with caption failed (%s), sending as text...", img_error)
+            
+            # If no image or image failed, send as text
+            if not sent_successfully:
+                # The message is fully escaped for MarkdownV2, so there is no plain-text retry
+                payload = {
+                    'chat_id': self.telegram_chat_id,
+                    'text': message,
+                    'parse_mode': 'MarkdownV2',
+                    'disable_web_page_preview': True
+                }
+                self._post_telegram(self._telegram_send_url, payload)
+            
+            logger.info("✓ Sent: %.50s...", opp['title'])
+            
+        except Exception as e:
+            logger.exception("✗ Error sending to Telegram: %s", e)
+    
+    def _select_random(self, items: List[Dict[str, Any]], k: int) -> List[Dict[str, Any]]:
+        """Pick up to k items uniformly at random in one pass (reservoir sampling, Algorithm R)"""
+        selected = []
+        for i, item in enumerate(items):
+            if i < k:
+                selected.append(item)
+            else:
+                j = self._rng.randint(0, i)
+                if j < k:
+                    selected[j] = item
+        return selected
     
     def run_workflow(self) -> None:
         """Execute the complete workflow"""
         # Check for quiet hours (10 PM to 7 AM)
-        current_hour = datetime.now().hour
-        if current_hour >= 22 or current_hour < 7:
-            logger.info("Quiet hours are active (10 PM - 7 AM). Skipping run.")
+        now = time.localtime()
+        if now.tm_hour >= QUIET_HOURS_START or now.tm_hour < QUIET_HOURS_END:
+            logger.info(f"Quiet hours are active ({QUIET_HOURS_START}:00 - {QUIET_HOURS_END}:00). Skipping run.")
             return
+        
+        # Formatted once per run for the log and the "Analyzed at" line of every message
+        self.run_timestamp = time.strftime('%Y-%m-%d %H:%M:%S', now)
             
         logger.info("="*60)
         logger.info("Starting VC & Startup News Analysis Workflow")
-        logger.info(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"Time: {self.run_timestamp}")
         logger.info("="*60)
         
         try:
@@ -740,6 +1442,13 @@ _Style: {style}_
                 logger.info("No new items to analyze. All items were duplicates.")
                 return
             
+            # Step 3b: Skip items with no VC/startup keywords before paying for AI analysis
+            new_items = self.filter_relevant(new_items)
+            
+            if not new_items:
+                logger.info("No new items to analyze. None matched the keyword prefilter.")
+                return
+            
             # Step 4: AI Analysis (only on new items)
             analyzed_items = self.analyze_with_gemini(new_items)
             
@@ -747,12 +1456,13 @@ _Style: {style}_
             opportunities = self.filter_opportunities(analyzed_items)
             
             # Step 6: Randomly select 1-3 opportunities to send
+            selected_opportunities = self._select_random(opportunities, self._rng.randint(*POSTS_PER_RUN))
             if opportunities:
-                max_posts = random.randint(1, 3)
-                selected_opportunities = random.sample(opportunities, min(max_posts, len(opportunities)))
                 logger.info(f"Randomly selected {len(selected_opportunities)} out of {len(opportunities)} opportunities to post")
-            else:
-                selected_opportunities = []
+            
+            # Render the messages up front, so sending is only network time
+            for opp in selected_opportunities:
+                opp['_msg'] = self._format_message(opp)
             
             # Step 7: Send to Telegram
             self.send_to_telegram(selected_opportunities)
@@ -761,8 +1471,8 @@ _Style: {style}_
             for item in selected_opportunities:
                 self._mark_as_analyzed(item)
             
-            # Step 9: Save history
-            self._save_history()
+            # Step 9: Expire old history
+            self._prune_history()
             
             logger.info("="*60)
             logger.info("Workflow completed successfully!")
@@ -771,6 +1481,20 @@ _Style: {style}_
         except Exception as e:
             logger.error(f"Workflow error: {str(e)}", exc_info=True)
             # Don't re-raise - let the bot continue running
+        finally:
+            self._close_driver()
+
+
+def next_run_time(now: datetime) -> datetime:
+    """Return the first scheduled run (see RUN_TIMES) strictly after now"""
+    candidates = []
+    for run_time in RUN_TIMES:
+        hour, minute = map(int, run_time.split(':'))
+        run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if run_at <= now:
+            run_at += timedelta(days=1)
+        candidates.append(run_at)
+    return min(candidates)
 
 
 def main():
@@ -790,12 +1514,10 @@ def main():
             logger.error(f"Initial workflow failed: {str(e)}", exc_info=True)
         
         # Schedule to run at specific times: 7am, noon, and 4pm
-        schedule.every().day.at("07:00").do(analyzer.run_workflow)
-        schedule.every().day.at("12:00").do(analyzer.run_workflow)
-        schedule.every().day.at("16:00").do(analyzer.run_workflow)
+        next_run = next_run_time(datetime.now())
         
-        logger.info("Scheduler started. Running at 7:00 AM, 12:00 PM, and 4:00 PM daily.")
-        logger.info("Press Ctrl+C to stop.")
+        logger.info(f"Scheduler started. Running daily at {', '.join(RUN_TIMES)}.")
+        logger.info(f"Next run at {next_run.strftime('%Y-%m-%d %H:%M')}. Press Ctrl+C to stop.")
         
         # Keep the script running with error recovery
         consecutive_errors = 0
@@ -803,9 +1525,16 @@ def main():
         
         while True:
             try:
-                schedule.run_pending()
+                # Sleep straight until the next run instead of polling every minute
+                remaining = (next_run - datetime.now()).total_seconds()
+                if remaining > 0:
+                    time.sleep(min(remaining, MAX_SLEEP_SECONDS))
+                    continue
+                
+                analyzer.run_workflow()
                 consecutive_errors = 0  # Reset on success
-                time.sleep(60)
+                next_run = next_run_time(datetime.now())
+                logger.info(f"Next run at {next_run.strftime('%Y-%m-%d %H:%M')}")
             except KeyboardInterrupt:
                 logger.info("Received shutdown signal. Exiting gracefully...")
                 break
@@ -817,7 +1546,8 @@ def main():
                     logger.critical(f"Too many consecutive errors ({max_consecutive_errors}). Shutting down.")
                     sys.exit(1)
                 
-                # Wait before retrying
+                # Wait before retrying, and don't re-run a job that just failed
+                next_run = next_run_time(datetime.now())
                 time.sleep(60)
     
     except Exception as e: